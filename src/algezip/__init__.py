@@ -10,6 +10,7 @@
 # test_zipper - tests the zipper data type defined in data.py
 # test_actions - tests the transformation functions from actions.py
 # test_source - tests (un)tokenization/parsing functions from source.py
+# test_interactive - tests command handling and script mode from interactive.py
 #
 # External dependencies:
 # No external dependencies needed to run the program
@@ -20,7 +21,7 @@
 # actions --> test_actions
 # source --> test_source
 # actions, source --> interactive
-# interactive --> __init__
+# interactive --> __init__, test_interactive
 
 __all__ = ['main']
 
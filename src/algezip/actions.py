@@ -40,11 +40,7 @@ __all__ = [
     'introduce_or_false',
 ]
 
-from algezip.data import BinaryOp, Expr
-
-# Used for formulating distributivity/factoring.
-# We have _duals[op0] == op1 if op0 is AND and op1 is OR or if op0 is OR and op1 is AND.
-_duals: dict[BinaryOp, BinaryOp] = {'&': '|', '|': '&'}
+from algezip.data import Expr
 
 
 class ActionError(Exception):
@@ -87,7 +83,11 @@ def introduce_and_true(expr: Expr) -> Expr:
 def distribute(expr: Expr) -> Expr:
     """Axiom: distributivity (left -> right)."""
     match expr:
-        case a, op0, (b, op1, c) if _duals[op0] == op1:
+        # Distributivity is formulated in terms of dual operators: op0 and op1 are duals
+        # if op0 is AND and op1 is OR or if op0 is OR and op1 is AND.
+        # Since AND and OR are the only binary operators, two binary operators are duals exactly when they differ,
+        # so checking op0 != op1 is enough.
+        case a, op0, (b, op1, c) if op0 != op1:
             return (a, op0, b), op1, (a, op0, c)
         case _:
             raise ActionError(
@@ -102,7 +102,9 @@ def distribute(expr: Expr) -> Expr:
 def factor(expr: Expr) -> Expr:
     """Axiom: distributivity (left <- right)."""
     match expr:
-        case (a, op0, b), op1, (a_, op0_, c) if a == a_ and op0 == op0_ and _duals[op0] == op1:
+        # As with distribute, op0 != op1 checks that op0 and op1 are duals.
+        # Check the operators before comparing the (possibly large) subexpressions a and a_.
+        case (a, op0, b), op1, (a_, op0_, c) if op0 == op0_ and op0 != op1 and a == a_:
             return a, op0, (b, op1, c)
         case _:
             raise ActionError(
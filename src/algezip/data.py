@@ -37,13 +37,16 @@ from typing import Literal, assert_never
 # modifying a without modifying b would require copying the entire list;
 # in contrast, if we have two variables a and b both pointing to the same cons list,
 # we can "push" to and "pop" from the front of a, without affecting b, in O(1) time.
+# Sharing a single Python list between a and b (with each remembering how much of the list it uses)
+# doesn't get around this -- as soon as a pops and then pushes something different, the list has to be copied,
+# and popping and then pushing something different is exactly what moving from one child to another does.
 #
 # In the comments/docstrings, we will write a ConsList like Cons(3, Cons(1, Cons(4, None))) as 3 -> 1 -> 4 -> (nil).
 # Given a ConsList (list), we will write a ConsList like Cons(1, Cons(5, (list))) as 1 -> 5 -> (list).
 ###
 
 
-@dataclass
+@dataclass(slots=True)
 class Cons[T]:
     car: T
     cdr: 'ConsList[T]'
@@ -60,10 +63,14 @@ type ConsList[T] = Cons[T] | None
 # especially since the infix notation for expressions is preserved.
 # Compare ((A, '|', B), '&', ('!', (A, '&', B))) with And(Or(A, B), Not(And(A, B))).
 # Thanks to Python's static typing tools, it's just as safe as using custom types, anyway.
+# Variable is frozen (and therefore hashable), so that every Expr is an immutable, hashable value --
+# subexpressions can be freely shared between expressions, and expressions can be used as dictionary keys.
+# Comparing two expressions that share subexpressions is cheap, since tuple comparison
+# checks for identity before equality when comparing elements.
 ###
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Variable:
     name: str
 
@@ -107,7 +114,7 @@ class Direction(Enum):
     RIGHT = '>'
 
 
-@dataclass
+@dataclass(slots=True)
 class Zipper:
     """
     A boolean expression together with a "focus" on a specific subexpression, which can be moved around for navigation.
@@ -128,62 +135,44 @@ class Zipper:
         (!a) -> (!a), (a & b) -> (a & b), (a | b) -> (a | b), (a & b) -> (a & b), (a | b) -> (a | b)
           ^     ^^^^   ^         ^^^^^^^   ^         ^^^^^^^       ^     ^^^^^^^       ^     ^^^^^^^
 
-        Raise NavigationError (via _move_up_with_direction) if there is no parent to move to.
+        Raise NavigationError if there is no parent to move to.
         """
-        new_zipper, _ = self._move_up_with_direction()
-        return new_zipper
+        match self.parents:
+            case Cons(parent, grandparents):
+                pass  # Just capture the variables for use below.
+            case None:
+                raise NavigationError('cannot move to parent -- already at the top')
+            case _ as unreachable:
+                assert_never(unreachable)
+        # expr: a                             -> expr: (parent with a in its hole)
+        # parents: (parent) -> (grandparents)    parents: (grandparents)
+        expr, _ = _fill_hole(parent, self.expr)
+        return Zipper(expr, grandparents)
 
-    def to_top(self) -> tuple[Expr, ConsList[Direction]]:
+    def to_top(self) -> tuple[Expr, list[Direction]]:
         """
         Return the top-level expression as an Expr along with directions for moving back to the current subexpression.
 
         ([a | b] & [!{a & b}]) -> ([a | b] & [!{a & b}])
-                      ^           RIGHT -> ARG -> LEFT -> (nil)
+                      ^           [RIGHT, ARG, LEFT]
 
         Do not ever raise NavigationError -- if we're already at the top,
         just return the current expression and an empty list for directions.
         """
-        directions: ConsList[Direction] = None
-        curr_zipper = self
-        # Build the list of directions from right to left, inner to outer.
+        directions: list[Direction] = []
+        expr = self.expr
+        parents = self.parents
+        # Collect the directions from inner to outer, then reverse them at the end.
         # ([a | b] & [!{a & b}]) -> ([a | b] & [!{a & b}]) -> ([a | b] & [!{a & b}]) -> ([a | b] & [!{a & b}])
         #               ^                        ^^^^^^^                 ^^^^^^^^^^     ^^^^^^^^^^^^^^^^^^^^^^
-        # (nil)                     LEFT -> (nil)             ARG -> LEFT -> (nil)      RIGHT -> ARG -> LEFT -> (nil)
-        while curr_zipper.parents:
-            parent_zipper, direction_to_curr = curr_zipper._move_up_with_direction()
-            directions = Cons(direction_to_curr, directions)
-            curr_zipper = parent_zipper
-        return curr_zipper.expr, directions
-
-    def _move_up_with_direction(self) -> tuple['Zipper', Direction]:
-        """
-        Move to the immediate parent, and return both the resulting zipper and the direction for moving back down.
-
-        Helper function for move_up (which doesn't need the direction) and to_top (which calls this repeatedly).
-
-        Raise NavigationError if there is no parent to move to.
-        """
-        match self.parents:
-            case Cons(parent, grandparents):
-                pass  # Just capture the variables for use below.
-            case None:
-                raise NavigationError('cannot move to parent -- already at the top')
-            case _ as unreachable:
-                assert_never(unreachable)
-        expr = self.expr
-        match parent:
-            case unary_op, '_':
-                # expr: a                         -> expr: (!a)
-                # parents: (!_) -> (grandparents)    parents: (grandparents)
-                return Zipper((unary_op, expr), grandparents), Direction.ARG
-            case '_', binary_op, right:
-                # expr: a                              -> expr: (a &/| b)
-                # parents: (_ &/| b) -> (grandparents)    parents: (grandparents)
-                return Zipper((expr, binary_op, right), grandparents), Direction.LEFT
-            case left, binary_op, '_':
-                # expr: b                              -> expr: (a &/| b)
-                # parents: (a &/| _) -> (grandparents)    parents: (grandparents)
-                return Zipper((left, binary_op, expr), grandparents), Direction.RIGHT
+        # []                        [LEFT]                    [LEFT, ARG]               [LEFT, ARG, RIGHT]
+        # Only the expression and the parents are needed at each step, so no intermediate zippers are created.
+        while parents:
+            expr, direction_to_curr = _fill_hole(parents.car, expr)
+            directions.append(direction_to_curr)
+            parents = parents.cdr
+        directions.reverse()
+        return expr, directions
 
     def move_arg(self) -> 'Zipper':
         """
@@ -246,3 +235,21 @@ class Zipper:
         # expr: a            -> expr: action(a)
         # parents: (parents)    parents: (parents)
         return Zipper(action(self.expr), self.parents)
+
+
+def _fill_hole(parent: Parent, expr: Expr) -> tuple[Expr, Direction]:
+    """
+    Put expr into the hole of parent, and return both the resulting expression and the direction for getting to expr.
+
+    Helper function for Zipper.move_up and Zipper.to_top.
+    """
+    match parent:
+        case unary_op, '_':
+            # (!_), a -> (!a)
+            return (unary_op, expr), Direction.ARG
+        case '_', binary_op, right:
+            # (_ &/| b), a -> (a &/| b)
+            return (expr, binary_op, right), Direction.LEFT
+        case left, binary_op, '_':
+            # (a &/| _), b -> (a &/| b)
+            return (left, binary_op, expr), Direction.RIGHT
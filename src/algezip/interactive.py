@@ -4,14 +4,16 @@ __all__ = ['main']
 
 import argparse
 import inspect
+import operator
+import string
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import assert_never
 
 from algezip import actions
 from algezip.actions import ActionError
 from algezip.data import Expr, NavigationError, Zipper
-from algezip.source import ParseError, parse, tokenize, unparse, untokenize
+from algezip.source import ParseError, parse_string, render
 
 
 def _print_blank_line() -> None:
@@ -48,6 +50,7 @@ def _print_help() -> None:
     print('f - [f]actoring -- ([a | b] & [a | c]) -> (a | [b & c]), ([a & b] | [a & c]) -> (a & [b | c])')
     print('v - complements/in[v]erses -- (a | [!a]) -> T, (a & [!a]) -> F')
     print('x a - e[x]pand into complements -- T -> (a | [!a]), F -> (a & [!a])')
+    print('3< - put a number before a command to repeat it, e.g. move focus to the left argument 3 times')
     print('help - print help')
     print('q! - quit')
 
@@ -58,6 +61,8 @@ def _print_help() -> None:
 # For commands without an argument, the user input must be the same as the command name (modulo surrounding whitespace).
 # For commands with an argument, the user input must be the command name, followed by a space, followed by the argument
 # (which should be a valid expression).
+# Either kind of command can be preceded by a repeat count -- a run of digits, as in 3< or 2x a --
+# to apply the command that many times in a row. The count must be between 1 and _max_repeat_count.
 # Commands without an argument provide a Zipper -> Zipper transformer function
 # for changing the expression that's being manipulated.
 # For commands with an argument, providing an argument to the zipper_transformer_with_argument function
@@ -83,18 +88,24 @@ def _transformer(action: Callable[[Expr], Expr]) -> Callable[[Zipper], Zipper]:
 
     Helper function, mainly for all the functions defined in actions.py.
     """
-    return lambda zipper: zipper.transform(action)
+    # Equivalent to lambda zipper: zipper.transform(action), but without an extra Python-level call per use.
+    # The trade-off is that methodcaller is typed as (Any) -> Any, so type checkers no longer check
+    # that action actually matches Zipper.transform's signature; the annotations on _transformer are what's left.
+    return operator.methodcaller('transform', action)
 
 
-# We could write Zipper.move_up etc. instead of lambda zipper: zipper.move_up(),
+# We could write Zipper.move_up etc. instead of operator.methodcaller('move_up'),
 # but that currently doesn't work well with PyCharm's type checking:
 # https://youtrack.jetbrains.com/issue/PY-71529/Incorrect-type-inferred-for-an-unbound-method-reference.
+# The navigation commands use methodcaller the same way _transformer does. Their method names are just strings,
+# so a typo like 'move_upp' only fails (with an AttributeError) when the command runs --
+# test_interactive exercises each navigation command to make up for that.
 commands: list[_CommandWithoutArgument | _CommandWithArgument] = [
     _CommandWithArgument('r!', lambda a: _transformer(lambda _: a)),
-    _CommandWithoutArgument('^', lambda zipper: zipper.move_up()),
-    _CommandWithoutArgument('.', lambda zipper: zipper.move_arg()),
-    _CommandWithoutArgument('<', lambda zipper: zipper.move_left()),
-    _CommandWithoutArgument('>', lambda zipper: zipper.move_right()),
+    _CommandWithoutArgument('^', operator.methodcaller('move_up')),
+    _CommandWithoutArgument('.', operator.methodcaller('move_arg')),
+    _CommandWithoutArgument('<', operator.methodcaller('move_left')),
+    _CommandWithoutArgument('>', operator.methodcaller('move_right')),
     _CommandWithoutArgument('c', _transformer(actions.apply_commutativity)),
     _CommandWithoutArgument('i', _transformer(actions.apply_identity)),
     _CommandWithoutArgument('|F', _transformer(actions.introduce_or_false)),
@@ -112,37 +123,99 @@ class CommandError(Exception):
     pass
 
 
+# Lookup tables for finding commands by name, built once from the list of commands.
+_commands_without_argument: dict[str, Callable[[Zipper], Zipper]] = {
+    command.name: command.zipper_transformer for command in commands if isinstance(command, _CommandWithoutArgument)
+}
+_commands_with_argument: dict[str, Callable[[Expr], Callable[[Zipper], Zipper]]] = {
+    command.name: command.zipper_transformer_with_argument
+    for command in commands
+    if isinstance(command, _CommandWithArgument)
+}
+
+
+# Large enough for any practical use, while keeping a mistyped count from running (practically) forever.
+_max_repeat_count = 1000
+
+
+def _repeat(zipper_transformer: Callable[[Zipper], Zipper], count: int) -> Callable[[Zipper], Zipper]:
+    """Return a function that applies zipper_transformer count times in a row."""
+
+    def repeated_zipper_transformer(zipper: Zipper) -> Zipper:
+        for _ in range(count):
+            zipper = zipper_transformer(zipper)
+        return zipper
+
+    return repeated_zipper_transformer
+
+
 def _get_zipper_transformer(user_input: str) -> Callable[[Zipper], Zipper]:
     """
     Based on the user input, return a function for changing the expression that's being manipulated.
 
-    Raise a CommandError if the user input does not denote a valid command.
+    The user input may start with a repeat count (<digits><command>, e.g. 3<),
+    in which case the returned function applies the command that many times in a row.
+
+    Raise a CommandError if the user input does not denote a valid command,
+    or if the repeat count is 0 or greater than _max_repeat_count (leading zeros are ignored).
     Indirectly raise a ParsingError if an expression provided as an argument is syntactically invalid.
 
     Precondition: user_input has been stripped of any leading and trailing whitespace.
     """
-    # Just do a linear search over the list of commands, matching based on name.
-    for command in commands:
-        match command:
-            case _CommandWithoutArgument(name, zipper_transformer):
-                if user_input == name:
-                    return zipper_transformer
-                elif user_input.startswith(name + ' '):
-                    raise CommandError(f'command {name!r} does not take an argument')
-                else:  # No match
-                    continue
-            case _CommandWithArgument(name, zipper_transformer_with_argument):
-                if user_input == name:
-                    raise CommandError(f'command {name!r} requires an argument')
-                elif user_input.startswith(name + ' '):
-                    argument_input = user_input.removeprefix(name).strip()
-                    argument = parse(tokenize(argument_input))
-                    return zipper_transformer_with_argument(argument)
-                else:  # No match
-                    continue
-            case _ as unreachable:
-                assert_never(unreachable)
-    raise CommandError('unrecognized command')
+    # An optional repeat count can come before the command name -- for example, 3< moves focus left three times.
+    command_input = user_input.lstrip(string.digits)
+    count_input = user_input.removesuffix(command_input)
+    # The command name is everything before the first space, and the argument (if any) is everything after it.
+    # Splitting is a single scan over the input, and is faster than recognizing command names with a regex.
+    name, space, argument_input = command_input.partition(' ')
+    zipper_transformer: Callable[[Zipper], Zipper]
+    if name in _commands_without_argument:
+        if space:
+            raise CommandError(f'command {name!r} does not take an argument')
+        zipper_transformer = _commands_without_argument[name]
+    elif name in _commands_with_argument:
+        if not space:
+            raise CommandError(f'command {name!r} requires an argument')
+        argument = parse_string(argument_input.strip())
+        zipper_transformer = _commands_with_argument[name](argument)
+    else:
+        raise CommandError('unrecognized command')
+    if not count_input:
+        return zipper_transformer
+    # Leading zeros don't affect the count (0001c means the same as 1c), so strip them before looking at its length.
+    digits = count_input.lstrip('0')
+    if not digits:
+        raise CommandError('repeat count must be positive')
+    # Check the length first, so that absurdly long counts are rejected without converting them to an int
+    # (which raises ValueError past a few thousand digits anyway).
+    if len(digits) > len(str(_max_repeat_count)) or int(digits) > _max_repeat_count:
+        raise CommandError(f'repeat count must be at most {_max_repeat_count}')
+    return _repeat(zipper_transformer, int(digits))
+
+
+def _run_script(script: list[str]) -> None:
+    """
+    Run a script of commands non-interactively, starting from F, and print the final expression.
+
+    Lines are run in order, just as if they were typed into the interactive prompt.
+    Blank lines and 'help' are skipped, and 'q!' ends the script early.
+    Upon the first error, print the error along with its line number, and exit with a nonzero status.
+    """
+    zipper = Zipper('F', None)
+    for line_number, line in enumerate(script, start=1):
+        user_input = line.strip()
+        if user_input == 'q!':
+            break
+        elif not user_input or user_input == 'help':
+            continue
+        try:
+            zipper_transformer = _get_zipper_transformer(user_input)
+            zipper = zipper_transformer(zipper)
+        except (ActionError, CommandError, NavigationError, ParseError) as e:
+            sys.exit(f'Error (line {line_number}): {e}')
+    expr_string, focus_string = render(zipper)
+    print(expr_string)
+    print(focus_string)
 
 
 def main() -> None:
@@ -153,14 +226,20 @@ def main() -> None:
             by applying boolean algebra axioms to transform them into equivalent expressions.
             Uses a "focusing" navigation system to allow for the manipulation of subexpressions,
             implemented via the functional programming concept of zippers (hence the name AlgeZip).
+            Commands can also be piped in through standard input, one per line,
+            in which case only the final expression is printed.
         """)
     )
     parser.parse_args()
+    # When commands are piped in instead of typed, there's no user to show prompts and intermediate results to.
+    if not sys.stdin.isatty():
+        _run_script(sys.stdin.read().splitlines())
+        return
     print('---AlgeZip---')
     print("For help, type 'help'")
     zipper = Zipper('F', None)
     while True:
-        expr_string, focus_string = untokenize(unparse(zipper))
+        expr_string, focus_string = render(zipper)
         _print_blank_line()
         print(expr_string)
         print(focus_string)
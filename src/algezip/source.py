@@ -14,23 +14,28 @@ Syntax overview:
 
 String --> boolean expression (for parsing expressions from user input):
 string ---tokenize--> token stream ---parse--> boolean expression
+parse_string does both steps at once, remembering the results for strings that have been parsed before.
 
 Boolean expression with focus --> string with focus (for printing the expression being manipulated and its focus):
 Zipper (boolean expression with focus) ---unparse--> token stream with focus
 ---untokenize--> (string, string) tuple (string with focus)
+render does both steps at once, for when the token stream itself isn't needed.
 
-Exports other than tokenize, parse, unparse, and untokenize:
+Exports other than tokenize, parse, parse_string, unparse, untokenize, and render:
     ParseError - raised when tokenizing/parsing strings that do not represent a valid boolean expression
     Token - intermediate representation used for both directions of expression <-> string conversion
     FocusToken - a token together with information on whether it represents the subexpression under focus
 """
 
-__all__ = ['FocusToken', 'ParseError', 'Token', 'parse', 'tokenize', 'unparse', 'untokenize']
+__all__ = ['FocusToken', 'ParseError', 'Token', 'parse', 'parse_string', 'render', 'tokenize', 'unparse', 'untokenize']
 
+import functools
+import string
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Literal, TypeGuard, assert_never
 
-from algezip.data import BinaryOp, Boolean, Cons, ConsList, Direction, Expr, UnaryOp, Variable, Zipper
+from algezip.data import BinaryOp, Boolean, Expr, Parent, UnaryOp, Variable, Zipper
 
 
 class ParseError(Exception):
@@ -47,17 +52,25 @@ class ParseError(Exception):
 type Token = Boolean | Variable | UnaryOp | BinaryOp | Literal['(', ')']
 # Defining special literal types for opening and closing brackets
 # doesn't seem to bring enough safety to be worth the hassle.
-_bracket_pairs = {('(', ')'), ('[', ']'), ('{', '}')}
 _opening_brackets = ['(', '[', '{']
 _closing_brackets = [')', ']', '}']
-
-
-def _is_simple_token(char: str) -> TypeGuard[Token]:
-    """Check if char is a character for which tokenization is a no-op."""
-    return char in {'F', 'T', '!', '&', '|'}
-
-
-def tokenize(expr_string: str) -> list[Token]:
+# Maps each closing bracket to its opening bracket, so that checking whether two brackets match is a single lookup.
+_matching_opening_brackets = dict(zip(_closing_brackets, _opening_brackets))
+# Variables are immutable, so there's no need to allocate a new one every time the same variable appears --
+# just share one Variable per name.
+_variable = functools.cache(Variable)
+# Lookup tables for tokenize, so that telling which kind of character we have is a single dictionary lookup.
+# Characters for which tokenization is a simple lookup (F, T, !, &, |, and ASCII variables) map to their tokens.
+_char_tokens: dict[str, Token] = {'F': 'F', 'T': 'T', '!': '!', '&': '&', '|': '|'}
+_char_tokens.update({name: _variable(name) for name in string.ascii_lowercase})
+type _CharKind = Literal['token', 'opening bracket', 'closing bracket', 'whitespace']
+_char_kinds: dict[str, _CharKind] = {char: 'token' for char in _char_tokens}
+_char_kinds.update({char: 'opening bracket' for char in _opening_brackets})
+_char_kinds.update({char: 'closing bracket' for char in _closing_brackets})
+_char_kinds.update({char: 'whitespace' for char in string.whitespace})
+
+
+def tokenize(expr_string: str) -> tuple[Token, ...]:
     """
     Tokenize the input.
 
@@ -65,48 +78,58 @@ def tokenize(expr_string: str) -> list[Token]:
     """
     stream: list[Token] = []
     # To check for balanced brackets, employ the standard stack-based algorithm.
-    unclosed_opening_brackets = []
+    unclosed_opening_brackets: list[str] = []
     for char in expr_string:
-        if _is_simple_token(char):  # F, T, !, &, |
-            stream.append(char)
-        elif char.islower():  # Variables
-            name = char
-            stream.append(Variable(name))
-        elif char in _opening_brackets:  # (
+        kind = _char_kinds.get(char)
+        if kind == 'token':  # F, T, !, &, |, (variable)
+            stream.append(_char_tokens[char])
+        elif kind == 'opening bracket':  # (
             unclosed_opening_brackets.append(char)
             stream.append('(')
-        elif char in _closing_brackets:  # )
+        elif kind == 'closing bracket':  # )
             closing_bracket = char
             if not unclosed_opening_brackets:
                 raise ParseError(f'unmatched bracket -- {closing_bracket!r}')
             opening_bracket = unclosed_opening_brackets.pop()
-            if (opening_bracket, closing_bracket) in _bracket_pairs:
+            if opening_bracket == _matching_opening_brackets[closing_bracket]:
                 stream.append(')')
             else:
                 raise ParseError(f'bad bracket match -- {opening_bracket!r} with {closing_bracket!r}')
+        elif kind == 'whitespace':
+            pass
+        # Characters not in the lookup tables -- non-ASCII lowercase letters are variables too,
+        # and non-ASCII whitespace is ignored like any other whitespace.
+        elif char.islower():  # Variables
+            name = char
+            stream.append(_variable(name))
         elif not char.isspace():
             raise ParseError(f'unrecognized character in boolean expression -- {char!r}')
     if unclosed_opening_brackets:
         opening_bracket = unclosed_opening_brackets.pop()
         raise ParseError(f'unmatched bracket -- {opening_bracket!r}')
-    return stream
+    # Token streams aren't modified after they're created, so hand them out as (tightly sized, immutable) tuples.
+    return tuple(stream)
 
 
 ###
-# _StackExpr and _StackElement: used for defining the type of elements in the stack used for parsing.
-# _StackExpr is a wrapper around Expr to allow for easy pattern matching isinstance checks.
+# _StackElement and _is_expr: used for handling elements in the stack used for parsing,
+# which contains both expressions and operators.
+# Operators are never expressions by themselves (and vice versa), so expressions can go on the stack as is --
+# telling the two apart only takes a type check and a comparison.
 ###
 
 
-@dataclass
-class _StackExpr:
-    expr: Expr
+type _StackElement = Expr | UnaryOp | BinaryOp
 
 
-type _StackElement = UnaryOp | BinaryOp | _StackExpr
+def _is_expr(element: _StackElement) -> TypeGuard[Expr]:
+    """Check if element is an expression (as opposed to an operator)."""
+    # The only expressions that are strings are F and T, and comparing non-strings to strings could (for variables)
+    # involve a Python-level __eq__ call, so check the type first.
+    return type(element) is not str or element not in {'!', '&', '|'}
 
 
-def parse(stream: list[Token]) -> Expr:
+def parse(stream: Sequence[Token]) -> Expr:
     """
     Parse the tokenized input.
 
@@ -120,7 +143,7 @@ def parse(stream: list[Token]) -> Expr:
     # Maintain a stack of indices such that, upon encountering a closing bracket,
     # the part of the parse stack corresponding to the subexpression within the brackets
     # is stack[opening_bracket_boundaries[-1]:].
-    opening_bracket_boundaries = []
+    opening_bracket_boundaries: list[int] = []
     # Example:
     # []: (, a, &, (, b, |, c, ), )
     #
@@ -143,40 +166,62 @@ def parse(stream: list[Token]) -> Expr:
     # [(a & (b | c))]: (done)
     #
     for token in stream:
-        match token:
-            case 'F' | 'T' | Variable() as expr:  # Values
-                stack.append(_StackExpr(expr))
-            case '!' | '&' | '|' as op:  # Operators
-                stack.append(op)
-            case '(':  # Opening bracket -- modify the opening bracket indices stack.
-                opening_bracket_boundaries.append(len(stack))
-            case ')':  # Closing bracket -- reduce.
-                boundary = opening_bracket_boundaries.pop()
-                within_brackets = stack[boundary:]
-                expr: Expr
-                match within_brackets:
-                    case '!', _StackExpr(arg):
-                        expr = '!', arg
-                    case _StackExpr(left), '&', _StackExpr(right):
-                        expr = left, '&', right
-                    case _StackExpr(left), '|', _StackExpr(right):
-                        expr = left, '|', right
-                    case _:
-                        raise ParseError('invalid syntax in boolean expression')
-                del stack[boundary:]
-                stack.append(_StackExpr(expr))
-            case _ as unreachable:
-                assert_never(unreachable)
+        # Only brackets need special handling -- values and operators alike are shifted onto the parse stack as is.
+        if type(token) is Variable:  # Values (variables) -- checked first for the same reason as in _is_expr.
+            stack.append(token)
+        elif token == '(':  # Opening bracket -- modify the opening bracket indices stack.
+            opening_bracket_boundaries.append(len(stack))
+        elif token == ')':  # Closing bracket -- reduce.
+            boundary = opening_bracket_boundaries.pop()
+            # The part of the parse stack within the brackets has to be 2 elements long for unary operations,
+            # and 3 elements long for binary operations -- pop those elements off directly
+            # instead of slicing them off (which would create a new list just to match against).
+            expr: Expr
+            match len(stack) - boundary:
+                case 2:
+                    arg = stack.pop()
+                    unary_op = stack.pop()
+                    match unary_op:
+                        case '!' if _is_expr(arg):
+                            expr = unary_op, arg
+                        case _:
+                            raise ParseError('invalid syntax in boolean expression')
+                case 3:
+                    right = stack.pop()
+                    binary_op = stack.pop()
+                    left = stack.pop()
+                    match binary_op:
+                        case '&' | '|' if _is_expr(left) and _is_expr(right):
+                            expr = left, binary_op, right
+                        case _:
+                            raise ParseError('invalid syntax in boolean expression')
+                case _:
+                    raise ParseError('invalid syntax in boolean expression')
+            stack.append(expr)
+        else:  # Values (F and T) and operators
+            stack.append(token)
     # Should never happen as long as the precondition is fulfilled.
     assert not opening_bracket_boundaries, f'brackets should be balanced: {stream}'
     match stack:
-        case [_StackExpr(expr)]:
-            return expr
+        case [result] if _is_expr(result):
+            return result
         case _:
             raise ParseError('invalid syntax in boolean expression')
 
 
-@dataclass
+# Expressions are immutable (see data.py), so the same expression can safely be handed out for every parse of a string.
+# Strings that fail to parse aren't cached, since the ParseError is raised through the cache.
+@functools.lru_cache(maxsize=1024)
+def parse_string(expr_string: str) -> Expr:
+    """
+    Tokenize and parse the input -- equivalent to parse(tokenize(expr_string)).
+
+    Raise ParseError (via tokenize or parse) if the input does not represent a valid boolean expression.
+    """
+    return parse(tokenize(expr_string))
+
+
+@dataclass(frozen=True, slots=True)
 class FocusToken:
     """A token along with information on whether the subexpression for the token is under focus."""
 
@@ -184,76 +229,138 @@ class FocusToken:
     under_focus: bool
 
 
-# Directions to the subexpression under focus (if reachable),
-# or an empty cons list (None) if we're already at the subexpression under focus (or one of its children),
-# or 'unfocused' if we took a different path and can no longer reach the subexpression under focus.
-type _FocusPath = ConsList[Direction] | Literal['unfocused']
-
+# FocusTokens are immutable, so unparse shares them instead of allocating a new one for every token.
+# Apart from variables, there are only two focus tokens for each token, so those are simply listed out here,
+# split by focus and looked up by token.
+_focus_tokens: dict[bool, dict[Token, FocusToken]] = {
+    under_focus: {token: FocusToken(token, under_focus) for token in ('F', 'T', '!', '&', '|', '(', ')')}
+    for under_focus in (False, True)
+}
+# There are arbitrarily many possible variables (tokenize accepts any letter as a variable name),
+# so only keep the focus tokens for recently unparsed variables around.
+_variable_focus_token = functools.lru_cache(maxsize=1024)(FocusToken)
 
-def _move_along_path(focus_path: _FocusPath, direction: Direction) -> _FocusPath:
-    """Take a direction, and return an updated focus path accordingly."""
-    match focus_path:
-        case Cons(next_direction, rest_of_path):
-            if next_direction is direction:  # Travel along the path.
-                return rest_of_path
-            else:  # Off the path now, subexpression with focus is no longer reachable.
-                return 'unfocused'
-        case None:  # Already under focus, subexpressions should also have the focus indicator.
-            return None
-        case 'unfocused':  # Can no longer reach focus, no matter what further directions are taken.
-            return 'unfocused'
-        case _ as unreachable:
-            assert_never(unreachable)
 
+def _parents_outer_to_inner(zipper: Zipper) -> list[Parent]:
+    """
+    Return the parents of the zipper's current subexpression as a list, from outermost to innermost.
 
-def unparse(zipper: Zipper) -> list[FocusToken]:
-    """Convert a zipper to a stream of tokens with focus information."""
-    top_level_expr, focus_path = zipper.to_top()
-    return _unparse_with_focus_path(top_level_expr, focus_path)
+    Helper function for unparse and render.
+    """
+    parents: list[Parent] = []
+    curr_parents = zipper.parents
+    while curr_parents:
+        parents.append(curr_parents.car)
+        curr_parents = curr_parents.cdr
+    parents.reverse()
+    return parents
 
 
-def _unparse_with_focus_path(expr: Expr, focus_path: _FocusPath) -> list[FocusToken]:
+def unparse(zipper: Zipper) -> tuple[FocusToken, ...]:
+    """Convert a zipper to a stream of tokens with focus information."""
+    stream: list[FocusToken] = []
+    # Unparse the zipper in place, instead of rebuilding the top-level expression with Zipper.to_top
+    # and then working out which of its subexpressions is under focus:
+    # everything in the current subexpression is under focus, and everything in the parents isn't.
+    # Each parent contributes some tokens before its hole and some tokens after its hole,
+    # wrapped around the tokens of the parents inside it:
+    # (!_) -> ( ! | ), (_ &/| b) -> ( | &/| b ), (a &/| _) -> ( a &/| | )
+    parents = _parents_outer_to_inner(zipper)
+    unfocused_tokens = _focus_tokens[False]
+    # Parts before the holes, from outer to inner.
+    for parent in parents:
+        match parent:
+            case unary_op, '_':  # (!_)
+                stream.append(unfocused_tokens['('])
+                stream.append(unfocused_tokens[unary_op])
+            case '_', _, _:  # (_ &/| b)
+                stream.append(unfocused_tokens['('])
+            case left, binary_op, '_':  # (a &/| _)
+                stream.append(unfocused_tokens['('])
+                _unparse_expr(left, False, stream)
+                stream.append(unfocused_tokens[binary_op])
+    _unparse_expr(zipper.expr, True, stream)
+    # Parts after the holes, from inner to outer.
+    for parent in reversed(parents):
+        match parent:
+            case _, '_':  # (!_)
+                stream.append(unfocused_tokens[')'])
+            case '_', binary_op, right:  # (_ &/| b)
+                stream.append(unfocused_tokens[binary_op])
+                _unparse_expr(right, False, stream)
+                stream.append(unfocused_tokens[')'])
+            case _, _, '_':  # (a &/| _)
+                stream.append(unfocused_tokens[')'])
+    return tuple(stream)
+
+
+def _unparse_expr(expr: Expr, under_focus: bool, stream: list[FocusToken]) -> None:
     """
-    Convert an expression to a stream of tokens, using the given focus path to determine focus information.
+    Convert an expression to tokens that are all either under focus or not under focus, appending them to stream.
 
     Helper function for unparse.
     """
-    under_focus = focus_path is None
-
-    ###
-    # Helper functions for reducing the number of times the same variable is written out over and over again.
-    ###
-
-    def ft(token: Token) -> FocusToken:
-        return FocusToken(token, under_focus)
-
-    def move(direction: Direction) -> _FocusPath:
-        return _move_along_path(focus_path, direction)
-
-    match expr:
-        case 'F' | 'T' | Variable() as value:  # Values -- already valid (regular) tokens.
-            return [ft(value)]
-        # For operators, use unpacking to achieve an effect similar to string interpolation.
-        case unary_op, arg:
-            return [
-                ft('('),
-                ft(unary_op),
-                *_unparse_with_focus_path(arg, move(Direction.ARG)),
-                ft(')'),
-            ]
-        case left, binary_op, right:
-            return [
-                ft('('),
-                *_unparse_with_focus_path(left, move(Direction.LEFT)),
-                ft(binary_op),
-                *_unparse_with_focus_path(right, move(Direction.RIGHT)),
-                ft(')'),
-            ]
-        case _ as unreachable:
-            assert_never(unreachable)
-
-
-def untokenize(stream: list[FocusToken]) -> tuple[str, str]:
+    # Walk the expression with an explicit stack instead of recursing, so that every token goes straight into stream
+    # (instead of into intermediate lists for every subexpression), and so that deep expressions can't hit the
+    # recursion limit.
+    # The stack holds whatever still needs to be emitted, next item on top: either tokens that are ready to go,
+    # or subexpressions that still need to be unparsed.
+    # Focus is the same for the whole expression, so subexpressions can go on the stack without any focus information.
+    # Example, for ([a | b] & c):
+    # stream: []           stack: [([a | b] & c)]
+    # stream: [(]          stack: [), c, &, (a | b)]
+    # stream: [(, (]       stack: [), c, &, ), b, |, a]
+    # stream: [(, (, a]    stack: [), c, &, ), b, |]
+    # ...
+    focus_tokens = _focus_tokens[under_focus]
+    stack: list[FocusToken | Expr] = [expr]
+    while stack:
+        curr = stack.pop()
+        # Tokens, values, and operations on the stack can all be told apart by their types alone.
+        if isinstance(curr, FocusToken):
+            stream.append(curr)
+        elif isinstance(curr, Variable):
+            stream.append(_variable_focus_token(curr, under_focus))
+        elif isinstance(curr, str):  # Booleans -- already valid (regular) tokens.
+            stream.append(focus_tokens[curr])
+        elif len(curr) == 2:  # (!a)
+            unary_op, arg = curr
+            stream.append(focus_tokens['('])
+            stream.append(focus_tokens[unary_op])
+            stack.append(focus_tokens[')'])
+            stack.append(arg)
+        else:  # (a &/| b)
+            left, binary_op, right = curr
+            stream.append(focus_tokens['('])
+            stack.append(focus_tokens[')'])
+            stack.append(right)
+            stack.append(focus_tokens[binary_op])
+            stack.append(left)
+
+
+_binary_op_strings: dict[BinaryOp, str] = {'&': ' & ', '|': ' | '}
+
+
+class _FocusStrings(dict[int, str]):
+    """Maps lengths to focus strings of that length, made of the given character and created as needed."""
+
+    def __init__(self, focus_char: str):
+        super().__init__()
+        self.focus_char = focus_char
+
+    def __missing__(self, length: int) -> str:
+        focus_string = self[length] = self.focus_char * length
+        return focus_string
+
+
+# Token strings are 1 character long (variables parsed from strings have single-letter names),
+# except for ' & ' and ' | ', so the same few focus strings get used over and over again.
+# Look them up instead of creating them every time: _focus_strings[under_focus][len(token_string)].
+# Variables created directly can have longer names, so other lengths are still filled in when needed.
+_focus_strings: dict[bool, _FocusStrings] = {False: _FocusStrings(' '), True: _FocusStrings('^')}
+
+
+def untokenize(stream: Sequence[FocusToken]) -> tuple[str, str]:
     """
     Convert a stream of tokens with focus information to an expression string and a string indicating focus.
 
@@ -261,29 +368,118 @@ def untokenize(stream: list[FocusToken]) -> tuple[str, str]:
     with the starts of both strings aligned.
     """
     # Use lists instead of concatenating to strings for efficiency.
-    expr_string_parts = []
-    focus_string_parts = []
-    # 3n -> (), 3n + 1 -> [], 3n + 2 -> {}
-    bracket_depth = 0
+    expr_string_parts: list[str] = []
+    focus_string_parts: list[str] = []
+    # Bracket depth 3n -> (), 3n + 1 -> [], 3n + 2 -> {}
+    # Only the bracket depth modulo 3 matters, so keep track of that directly, wrapping around by hand.
+    bracket_type = 0
     for focus_token in stream:
+        token_string: str
         match focus_token.token:
             case 'F' | 'T' | '!' as token:
                 token_string = token
             case Variable(name):
                 token_string = name
             case '&' | '|' as token:
-                token_string = f' {token} '
+                token_string = _binary_op_strings[token]
             case '(':
-                token_string = _opening_brackets[bracket_depth % 3]
-                bracket_depth += 1
+                token_string = _opening_brackets[bracket_type]
+                bracket_type = 0 if bracket_type == 2 else bracket_type + 1
             case ')':
                 # Need to decrease the depth first in order for the brackets to match up.
-                bracket_depth -= 1
-                token_string = _closing_brackets[bracket_depth % 3]
+                bracket_type = 2 if bracket_type == 0 else bracket_type - 1
+                token_string = _closing_brackets[bracket_type]
             case _ as unreachable:
                 assert_never(unreachable)
         expr_string_parts.append(token_string)
-        token_focus_char = '^' if focus_token.under_focus else ' '
-        token_focus_string = token_focus_char * len(token_string)
-        focus_string_parts.append(token_focus_string)
+        focus_string_parts.append(_focus_strings[focus_token.under_focus][len(token_string)])
     return ''.join(expr_string_parts), ''.join(focus_string_parts)
+
+
+def render(zipper: Zipper) -> tuple[str, str]:
+    """
+    Convert a zipper to an expression string and a string indicating focus.
+
+    Equivalent to untokenize(unparse(zipper)), but builds the strings directly, without creating tokens in between.
+    """
+    expr_string_parts: list[str] = []
+    focus_string_parts: list[str] = []
+    # Go through the zipper the same way as unparse, appending strings instead of tokens.
+    # Bracket type 0 -> (), 1 -> [], 2 -> {} -- for the parents, that's their depth modulo 3.
+    unfocused_strings = _focus_strings[False]
+    parents = _parents_outer_to_inner(zipper)
+    for depth, parent in enumerate(parents):
+        bracket_type = depth % 3
+        expr_string_parts.append(_opening_brackets[bracket_type])
+        focus_string_parts.append(unfocused_strings[1])
+        match parent:
+            case unary_op, '_':  # (!_)
+                expr_string_parts.append(unary_op)
+                focus_string_parts.append(unfocused_strings[1])
+            case '_', _, _:  # (_ &/| b)
+                pass
+            case left, binary_op, '_':  # (a &/| _)
+                inner_bracket_type = 0 if bracket_type == 2 else bracket_type + 1
+                _render_expr(left, False, inner_bracket_type, expr_string_parts, focus_string_parts)
+                expr_string_parts.append(_binary_op_strings[binary_op])
+                focus_string_parts.append(unfocused_strings[3])
+    _render_expr(zipper.expr, True, len(parents) % 3, expr_string_parts, focus_string_parts)
+    for depth in reversed(range(len(parents))):
+        bracket_type = depth % 3
+        match parents[depth]:
+            case _, '_':  # (!_)
+                pass
+            case '_', binary_op, right:  # (_ &/| b)
+                expr_string_parts.append(_binary_op_strings[binary_op])
+                focus_string_parts.append(unfocused_strings[3])
+                inner_bracket_type = 0 if bracket_type == 2 else bracket_type + 1
+                _render_expr(right, False, inner_bracket_type, expr_string_parts, focus_string_parts)
+            case _, _, '_':  # (a &/| _)
+                pass
+        expr_string_parts.append(_closing_brackets[bracket_type])
+        focus_string_parts.append(unfocused_strings[1])
+    return ''.join(expr_string_parts), ''.join(focus_string_parts)
+
+
+def _render_expr(
+    expr: Expr, under_focus: bool, bracket_type: int, expr_string_parts: list[str], focus_string_parts: list[str]
+) -> None:
+    """
+    Convert an expression (starting with the given bracket type) to strings, appending them to the given lists.
+
+    Helper function for render.
+    """
+    focus_strings = _focus_strings[under_focus]
+    # Walk the expression the same way as _unparse_expr, except that the stack holds strings that are ready to go
+    # instead of tokens.
+    # Focus is the same for the whole expression, so focus strings can be decided on when the strings are emitted.
+    # Subexpressions on the stack come with the type of bracket to put around them, so that closing brackets
+    # can be decided on as soon as they're put on the stack.
+    stack: list[str | tuple[Expr, int]] = [(expr, bracket_type)]
+    while stack:
+        curr = stack.pop()
+        # Use isinstance rather than comparing types directly, so that type checkers can narrow the types.
+        if isinstance(curr, str):
+            expr_string_parts.append(curr)
+            focus_string_parts.append(focus_strings[len(curr)])
+            continue
+        curr_expr, curr_bracket_type = curr
+        if not isinstance(curr_expr, tuple):  # Values
+            value_string = curr_expr.name if isinstance(curr_expr, Variable) else curr_expr
+            expr_string_parts.append(value_string)
+            focus_string_parts.append(focus_strings[len(value_string)])
+            continue
+        inner_bracket_type = 0 if curr_bracket_type == 2 else curr_bracket_type + 1
+        expr_string_parts.append(_opening_brackets[curr_bracket_type])
+        focus_string_parts.append(focus_strings[1])
+        stack.append(_closing_brackets[curr_bracket_type])
+        if len(curr_expr) == 2:  # (!a)
+            unary_op, arg = curr_expr
+            expr_string_parts.append(unary_op)
+            focus_string_parts.append(focus_strings[1])
+            stack.append((arg, inner_bracket_type))
+        else:  # (a &/| b)
+            left, binary_op, right = curr_expr
+            stack.append((right, inner_bracket_type))
+            stack.append(_binary_op_strings[binary_op])
+            stack.append((left, inner_bracket_type))
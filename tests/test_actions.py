@@ -72,7 +72,7 @@ def test_introduce_and_true(initial: Expr, final: Expr | None):
     _assert_action_result(actions.introduce_and_true, initial, final)
 
 
-# Need to make sure that the _duals[op0] == op1 check works properly.
+# Need to make sure that the op0 != op1 check works properly.
 @pytest.mark.parametrize(
     ['initial', 'final'],
     [
@@ -87,7 +87,7 @@ def test_distribute(initial: Expr, final: Expr | None):
     _assert_action_result(actions.distribute, initial, final)
 
 
-# Need to make sure that a variety of checks work properly: _duals[op0] == op1, op0 == op0_, a == a_.
+# Need to make sure that a variety of checks work properly: op0 == op0_, op0 != op1, a == a_.
 @pytest.mark.parametrize(
     ['initial', 'final'],
     [
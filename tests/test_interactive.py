@@ -0,0 +1,92 @@
+"""Tests for the non-interactive parts of interactive.py."""
+
+import pytest
+
+from algezip.data import Variable, Zipper
+from algezip.interactive import CommandError, _get_zipper_transformer, _run_script
+from algezip.source import ParseError
+
+A = Variable('a')
+B = Variable('b')
+C = Variable('c')
+
+_ZIPPER = Zipper((A, '&', (B, '|', C)), None)
+
+
+# Similarly to test_source, use None to indicate that a function should raise an error (a CommandError here).
+
+
+@pytest.mark.parametrize(
+    ['user_input', 'expected'],
+    [
+        ('c', Zipper(((B, '|', C), '&', A), None)),
+        ('<', _ZIPPER.move_left()),
+        ('r! (a | b)', Zipper((A, '|', B), None)),
+        ('r!   {a | b}', Zipper((A, '|', B), None)),
+        ('2c', _ZIPPER),
+        ('3c', Zipper(((B, '|', C), '&', A), None)),
+        ('1>', _ZIPPER.move_right()),
+        ('3r! a', Zipper(A, None)),
+        ('1000c', _ZIPPER),
+        ('00000001c', Zipper(((B, '|', C), '&', A), None)),
+        ('0' * 5000 + '1c', Zipper(((B, '|', C), '&', A), None)),
+        ('c a', None),
+        ('r!', None),
+        ('q', None),
+        ('3 <', None),
+        ('33', None),
+        ('0c', None),
+        ('000c', None),
+        ('1001c', None),
+        ('1' * 5000 + 'c', None),
+    ],
+)
+def test_get_zipper_transformer(user_input: str, expected: Zipper | None):
+    if expected is not None:
+        assert _get_zipper_transformer(user_input)(_ZIPPER) == expected
+    else:
+        with pytest.raises(CommandError):
+            _get_zipper_transformer(user_input)
+
+
+def test_get_zipper_transformer_invalid_argument():
+    with pytest.raises(ParseError):
+        _get_zipper_transformer('r! (a | b')
+
+
+# For script mode, use None as the expected output to indicate that the script should exit with an error,
+# along with the line number that the error should be reported for (None if there shouldn't be an error).
+
+
+@pytest.mark.parametrize(
+    ['script', 'expected_output', 'expected_error_line'],
+    [
+        (['r! (a | b)', 'c'], '(b | a)\n^^^^^^^\n', None),
+        (['r! (a | b)', '<'], '(a | b)\n ^     \n', None),
+        (['r! (a | b)', '<', '^'], '(a | b)\n^^^^^^^\n', None),
+        (['r! (!a)', '.'], '(!a)\n  ^ \n', None),
+        (['', '  r! (a | b)  ', 'help', '', '>'], '(a | b)\n     ^ \n', None),
+        (['r! (a | b)', 'q!', 'c'], '(a | b)\n^^^^^^^\n', None),
+        ([], 'F\n^\n', None),
+        (['r! (a | b)', 'x'], None, 2),
+        (['r! (a | b)', '.'], None, 2),
+        (['r! (a | b)', 'q'], None, 2),
+        (['r! (a |'], None, 1),
+        # Lines run in order, so an earlier action error is reported before a later parse error.
+        (['c', 'r! ('], None, 1),
+    ],
+)
+def test_run_script(
+    capsys: pytest.CaptureFixture[str],
+    script: list[str],
+    expected_output: str | None,
+    expected_error_line: int | None,
+):
+    if expected_error_line is None:
+        _run_script(script)
+        assert capsys.readouterr().out == expected_output
+    else:
+        with pytest.raises(SystemExit) as exc_info:
+            _run_script(script)
+        assert str(exc_info.value.code).startswith(f'Error (line {expected_error_line}): ')
+        assert capsys.readouterr().out == ''
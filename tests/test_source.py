@@ -1,9 +1,21 @@
 """Tests for the boolean expression <-> string conversion functions."""
 
+import sys
+
 import pytest
 
 from algezip.data import Expr, Variable, Zipper
-from algezip.source import FocusToken, ParseError, Token, parse, tokenize, unparse, untokenize
+from algezip.source import (
+    FocusToken,
+    ParseError,
+    Token,
+    parse,
+    parse_string,
+    render,
+    tokenize,
+    unparse,
+    untokenize,
+)
 
 A = Variable('a')
 B = Variable('b')
@@ -20,6 +32,7 @@ C = Variable('c')
         ('{T & F}', ['(', 'T', '&', 'F', ')']),
         ('[![!T]]', ['(', '!', '(', '!', 'T', ')', ')']),
         (' ( ! { ! T } ) ', ['(', '!', '(', '!', 'T', ')', ')']),
+        ('(\u00e9 &\u3000b)', ['(', Variable('\u00e9'), '&', B, ')']),  # Non-ASCII lowercase letters and whitespace
         ('([a | b] & [!{a & b}])', ['(', '(', A, '|', B, ')', '&', '(', '!', '(', A, '&', B, ')', ')', ')']),
         ('((a|b)&(!(a&b)))', ['(', '(', A, '|', B, ')', '&', '(', '!', '(', A, '&', B, ')', ')', ')']),
         ('([A | B] & [!{A & B}])', None),
@@ -32,7 +45,7 @@ C = Variable('c')
 )
 def test_tokenize(expr_string: str, expected: list[Token] | None):
     if expected is not None:
-        assert tokenize(expr_string) == expected
+        assert tokenize(expr_string) == tuple(expected)
     else:
         with pytest.raises(ParseError):
             tokenize(expr_string)
@@ -69,6 +82,28 @@ def test_parse(stream: list[Token], expected: Expr | None):
             parse(stream)
 
 
+@pytest.mark.parametrize(
+    ['expr_string', 'expected'],
+    [
+        ('([a | b] & [!{a & b}])', ((A, '|', B), '&', ('!', (A, '&', B)))),
+        ('(T)', None),
+        ('(T | F', None),
+    ],
+)
+def test_parse_string(expr_string: str, expected: Expr | None):
+    if expected is not None:
+        result = parse_string(expr_string)
+        assert result == expected
+        # The second call should hit the cache and hand back the very same expression.
+        assert parse_string(expr_string) is result
+    else:
+        # Failed parses shouldn't take up space in the cache.
+        cache_size = parse_string.cache_info().currsize
+        with pytest.raises(ParseError):
+            parse_string(expr_string)
+        assert parse_string.cache_info().currsize == cache_size
+
+
 # Stringification tests: it would be tedious to manually specify which tokens should have focus,
 # so specify a range of indices instead.
 #
@@ -140,3 +175,41 @@ def test_untokenize(expr_strings: tuple[str, str], tokens: list[Token], focus_st
     focus_indices = range(focus_start, focus_stop)
     focus_tokens = [FocusToken(token, under_focus=i in focus_indices) for i, token in enumerate(tokens)]
     assert untokenize(focus_tokens) == expr_strings
+
+
+@pytest.mark.parametrize(
+    ['zipper', 'expected_expr_strings'],
+    [
+        (Zipper(('T', '|', 'F'), None).move_left(), _T_OR_F_TESTCASE_EXPR_STRINGS),
+        *((zipper, expr_strings) for expr_strings, zipper, _, _ in _ZIPPER_TEST_DATA),
+    ],
+)
+def test_render(zipper: Zipper, expected_expr_strings: tuple[str, str]):
+    assert render(zipper) == expected_expr_strings
+
+
+def test_long_variable_names():
+    # Variables parsed from strings always have single-letter names, but Variables can be created with any name.
+    zipper = Zipper((Variable('ab'), '&', ('!', Variable('cde'))), None).move_left()
+    assert untokenize(unparse(zipper)) == ('(ab & [!cde])', ' ^^          ')
+    assert render(zipper) == ('(ab & [!cde])', ' ^^          ')
+    assert render(zipper.move_up().move_right()) == ('(ab & [!cde])', '      ^^^^^^ ')
+
+
+def test_unparse_deeply_nested():
+    # Nested deeper than the recursion limit, to make sure that unparsing doesn't rely on recursion.
+    depth = sys.getrecursionlimit() + 1
+    expr: Expr = 'T'
+    for _ in range(depth):
+        expr = '!', expr
+    expected_tokens = ['(', '!'] * depth + ['T'] + [')'] * depth
+    actual_tokens = [focus_token.token for focus_token in unparse(Zipper(expr, None))]
+    assert actual_tokens == expected_tokens
+    # Same with the focus at the very bottom, where everything else is in the parents.
+    zipper = Zipper(expr, None)
+    for _ in range(depth):
+        zipper = zipper.move_arg()
+    actual_focus_tokens = unparse(zipper)
+    assert [focus_token.token for focus_token in actual_focus_tokens] == expected_tokens
+    actual_focus_indices = {i for i, focus_token in enumerate(actual_focus_tokens) if focus_token.under_focus}
+    assert actual_focus_indices == {2 * depth}
@@ -27,7 +27,7 @@ def test_touch_left_a():
     assert zipper == Zipper(A, Cons(('_', '|', B), Cons(('_', '&', ('!', (A, '&', B))), None)))
     expr, directions = zipper.to_top()
     assert expr == _ZIPPER.expr
-    assert directions == Cons(Direction.LEFT, Cons(Direction.LEFT, None))
+    assert directions == [Direction.LEFT, Direction.LEFT]
 
 
 def test_touch_left_b():
@@ -38,7 +38,7 @@ def test_touch_left_b():
     assert zipper == Zipper(B, Cons((A, '|', '_'), Cons(('_', '&', ('!', (A, '&', B))), None)))
     expr, directions = zipper.to_top()
     assert expr == _ZIPPER.expr
-    assert directions == Cons(Direction.LEFT, Cons(Direction.RIGHT, None))
+    assert directions == [Direction.LEFT, Direction.RIGHT]
 
 
 def test_touch_right_a():
@@ -49,7 +49,7 @@ def test_touch_right_a():
     assert zipper == Zipper(A, Cons(('_', '&', B), Cons(('!', '_'), Cons(((A, '|', B), '&', '_'), None))))
     expr, directions = zipper.to_top()
     assert expr == _ZIPPER.expr
-    assert directions == Cons(Direction.RIGHT, Cons(Direction.ARG, Cons(Direction.LEFT, None)))
+    assert directions == [Direction.RIGHT, Direction.ARG, Direction.LEFT]
 
 
 def test_touch_right_b():
@@ -60,7 +60,7 @@ def test_touch_right_b():
     assert zipper == Zipper(B, Cons((A, '&', '_'), Cons(('!', '_'), Cons(((A, '|', B), '&', '_'), None))))
     expr, directions = zipper.to_top()
     assert expr == _ZIPPER.expr
-    assert directions == Cons(Direction.RIGHT, Cons(Direction.ARG, Cons(Direction.RIGHT, None)))
+    assert directions == [Direction.RIGHT, Direction.ARG, Direction.RIGHT]
 
 
 def test_tree_walk():